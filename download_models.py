@@ -1,7 +1,20 @@
+import importlib.util
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from huggingface_hub import snapshot_download
-from utils import AVAILABLE_MODELS, HF_MODEL_MAPPING, logger
+# hf_transfer is only used when installed, otherwise huggingface_hub refuses to download
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from huggingface_hub import snapshot_download  # noqa: E402
+from utils import AVAILABLE_MODELS, HF_MODEL_MAPPING, logger  # noqa: E402
+
+MAX_PARALLEL_MODELS = 4
+MAX_FILE_WORKERS = 8
+
+
+def is_model_downloaded(local_path: str) -> bool:
+    return os.path.isfile(os.path.join(local_path, "model.bin"))
 
 
 def download_model(model_name: str, repo_id: str, local_path: str) -> None:
@@ -9,8 +22,8 @@ def download_model(model_name: str, repo_id: str, local_path: str) -> None:
         snapshot_download(
             repo_id=repo_id,
             local_dir=local_path,
-            local_dir_use_symlinks=False,
             cache_dir=None,
+            max_workers=MAX_FILE_WORKERS,
         )
         logger.info(f"Model {model_name} downloaded to {local_path}")
 
@@ -18,14 +31,19 @@ def download_model(model_name: str, repo_id: str, local_path: str) -> None:
         logger.error(f"Error downloading {model_name}: {e}")
 
 
+def _download_one(item: tuple[str, str]) -> None:
+    model_name, local_path = item
+    logger.info(f"Downloading model: {model_name}")
+
+    repo_id = HF_MODEL_MAPPING[model_name]
+    download_model(model_name=model_name, repo_id=repo_id, local_path=local_path)
+
+
 def download_models() -> None:
     os.makedirs("./models", exist_ok=True)
 
-    for model_name, local_path in AVAILABLE_MODELS.items():
-        logger.info(f"Downloading model: {model_name}")
-
-        repo_id = HF_MODEL_MAPPING[model_name]
-        download_model(model_name=model_name, repo_id=repo_id, local_path=local_path)
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_MODELS) as executor:
+        list(executor.map(_download_one, AVAILABLE_MODELS.items()))
 
 
 if __name__ == "__main__":
@@ -1,17 +1,28 @@
+import multiprocessing
 import os
 import queue
-import tempfile
-import threading
-import time
 import tkinter as tk
+from multiprocessing.context import SpawnProcess
+from multiprocessing.queues import Queue
 from tkinter import filedialog, messagebox, ttk
 from typing import Callable
 
-from download_models import download_model
-from faster_whisper import WhisperModel
-from huggingface_hub.errors import HFValidationError
-from moviepy import VideoFileClip
-from utils import AVAILABLE_MODELS, HF_MODEL_MAPPING, AppState, Language
+import worker
+from utils import (
+    AUTO_DEVICE,
+    COMPUTE_TYPES,
+    DEVICES,
+    LANGUAGE_VALUES,
+    MODEL_SIZES,
+    AppState,
+    Language,
+    TranscriptionSettings,
+)
+
+QUEUE_MESSAGES_PER_TICK = 64
+QUEUE_POLL_IDLE_MS = 100
+QUEUE_POLL_BUSY_MS = 10
+WORKER_JOIN_TIMEOUT_S = 5
 
 
 class TranscriptionGUI:
@@ -21,20 +32,30 @@ class TranscriptionGUI:
         self.root.geometry("600x600")
         self.root.resizable(True, True)
 
-        self.stop_flag = threading.Event()
-        self.transcription_thread: threading.Thread | None = None
+        # Transcription runs in a separate process so it never competes with Tk for the GIL.
+        # "spawn" avoids forking the Tk interpreter state into the child.
+        self.mp_context = multiprocessing.get_context("spawn")
+        self.stop_flag = self.mp_context.Event()
+        self.job_queue: "Queue[TranscriptionSettings | None]" = self.mp_context.Queue()
+        self.result_queue: "Queue[tuple[str, str | None]]" = self.mp_context.Queue()
+        self.worker_process: SpawnProcess | None = None
         self.is_transcribing = False
 
-        self.result_queue: queue.Queue[tuple[str, str | None]] = queue.Queue()
-
         self.state = AppState(
             audio_file=tk.StringVar(),
             output_file=tk.StringVar(),
             language=tk.StringVar(value=Language.AUTO),
             model_size=tk.StringVar(value="base"),
+            device=tk.StringVar(value=AUTO_DEVICE),
+            compute_type=tk.StringVar(value=AUTO_DEVICE),
+            batch_size=tk.IntVar(value=16),
+            vad_filter=tk.BooleanVar(value=True),
         )
 
         self.setup_ui()
+        self.state.device.trace_add("write", self.on_device_changed)
+        self.state.vad_filter.trace_add("write", self.on_vad_filter_changed)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.check_queue()
 
@@ -110,12 +131,22 @@ class TranscriptionGUI:
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
+    def on_device_changed(self, *_: str) -> None:
+        """Offer only compute types supported by selected device and reset to its default."""
+        compute_types = COMPUTE_TYPES[self.state.device.get()]
+        self.compute_type_combo.config(values=compute_types)
+        self.state.compute_type.set(compute_types[0])
+
+    def on_vad_filter_changed(self, *_: str) -> None:
+        """Batch size only applies to batched inference, which requires VAD."""
+        self.batch_size_spinbox.config(state="readonly" if self.state.vad_filter.get() else tk.DISABLED)
+
     def update_status(self, status: str) -> None:
         """Update status."""
         self.status_label.config(text=status)
 
     def start_transcription(self) -> None:
-        """Start transcription in separate thread."""
+        """Start transcription in worker process."""
         if self.is_transcribing:
             return
 
@@ -140,163 +171,76 @@ class TranscriptionGUI:
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
 
-        self.transcription_thread = threading.Thread(target=self.transcription_worker, daemon=True)
-        self.transcription_thread.start()
+        self.ensure_worker_process()
+        self.job_queue.put(self.state.snapshot())
+
+    def ensure_worker_process(self) -> None:
+        """Start worker process if it is not running yet. It keeps loaded model between runs."""
+        if self.worker_process is not None and self.worker_process.is_alive():
+            return
+
+        self.worker_process = self.mp_context.Process(
+            target=worker.run,
+            args=(self.job_queue, self.result_queue, self.stop_flag),
+            daemon=True,
+        )
+        self.worker_process.start()
+
+    def on_close(self) -> None:
+        """Let worker process finish current write and exit before closing window."""
+        self.stop_flag.set()
+        if self.worker_process is not None and self.worker_process.is_alive():
+            self.job_queue.put(None)
+            self.worker_process.join(timeout=WORKER_JOIN_TIMEOUT_S)
+            if self.worker_process.is_alive():
+                self.worker_process.terminate()
+        self.root.destroy()
 
     def stop_transcription(self) -> None:
         """Stop transcription."""
         self.stop_flag.set()
         self.update_status("Stopping...")
 
-    def is_video_file(self, file_path: str) -> bool:
-        """Check if file is a video file based on extension."""
-        video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-        file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in video_extensions
-
-    def extract_audio_from_video(self, video_path: str) -> str:
-        """Extract audio from video file and return path to temporary audio file."""
-        self.result_queue.put(("status", "Extracting audio from video..."))
-        self.result_queue.put(("log", f"Extracting audio from video: {os.path.basename(video_path)}"))
-        
-        # Create temporary audio file
-        temp_audio = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-        temp_audio_path = temp_audio.name
-        temp_audio.close()
-        
-        try:
-            video = VideoFileClip(video_path)
-            if video.audio is None:
-                raise ValueError("Video file does not contain an audio track")
-            
-            video.audio.write_audiofile(
-                temp_audio_path,
-                codec='pcm_s16le',
-                logger=None
-            )
-            video.close()
-            
-            self.result_queue.put(("log", "Audio extracted successfully"))
-            return temp_audio_path
-        except Exception as e:
-            # Clean up temp file if extraction failed
-            if os.path.exists(temp_audio_path):
-                os.unlink(temp_audio_path)
-            raise Exception(f"Failed to extract audio from video: {str(e)}")
-
-    def transcription_worker(self) -> None:
-        """Worker function for transcription in separate thread."""
-        temp_audio_path = None
-        try:
-            input_path = self.state.audio_file.get()
-            output_path = self.state.output_file.get()
-            language = self.state.language.get() if self.state.language.get() != "auto" else None
-            model_size = self.state.model_size.get()
-
-            # Extract audio from video if needed
-            if self.is_video_file(input_path):
-                if self.stop_flag.is_set():
-                    return
-                temp_audio_path = self.extract_audio_from_video(input_path)
-                audio_path = temp_audio_path
-            else:
-                audio_path = input_path
-
-            self.result_queue.put(("status", "Loading model..."))
-            self.result_queue.put(("log", f"Loading model: {model_size}"))
-
-            if self.stop_flag.is_set():
-                return
-
-            try:
-                model_path = AVAILABLE_MODELS[model_size]
-                model = WhisperModel(model_path, device="cpu", compute_type="int8", local_files_only=True)
-
-            except KeyError:
-                self.result_queue.put(("log", f"Model '{model_size}' not found, using 'base'"))
-                model_path = AVAILABLE_MODELS["base"]
-                model = WhisperModel(model_path, device="cpu", compute_type="int8", local_files_only=True)
-
-            except HFValidationError:
-                self.result_queue.put(("log", f"Model '{model_size}' not found, downloading..."))
-                model_path = AVAILABLE_MODELS[model_size]
-                repo_id = HF_MODEL_MAPPING[model_size]
-                download_model(model_name=model_size, repo_id=repo_id, local_path=model_path)
-                self.result_queue.put(("log", f"Model '{model_size}' downloaded successfully"))
-                model = WhisperModel(model_path, device="cpu", compute_type="int8", local_files_only=True)
-
-            if self.stop_flag.is_set():
-                return
-
-            self.result_queue.put(("status", "Transcribing..."))
-            self.result_queue.put(("log", f"Starting transcription of file: {os.path.basename(input_path)}"))
-
-            segments, info = model.transcribe(audio_path, beam_size=1, language=language)
-
-            if self.stop_flag.is_set():
-                return
-
-            self.result_queue.put(
-                ("log", f"Detected language: {info.language} (probability: {info.language_probability:.2f})")
-            )
-            self.result_queue.put(("log", f"Approximate duration: {info.duration:.2f} seconds"))
-
-            processed_segments = 0
-
-            with open(output_path, "w", encoding="utf-8") as f:
-                for i, segment in enumerate(segments, start=1):
-                    if self.stop_flag.is_set():
-                        self.result_queue.put(("log", "Transcription stopped by user"))
-                        break
-
-                    # Write segment text
-                    line = f"{segment.text.strip()}\n"
-                    f.write(line)
-                    processed_segments += 1
-
-                    time.sleep(0.001)
-
-            if not self.stop_flag.is_set():
-                self.result_queue.put(("log", f"Transcription completed! Processed segments: {processed_segments}"))
-                self.result_queue.put(("log", f"Result saved to: {output_path}"))
-                self.result_queue.put(("success", "Transcription completed successfully!"))
-
-        except Exception as e:
-            error_msg = f"An error occurred: {str(e)}"
-            self.result_queue.put(("error", error_msg))
-            self.result_queue.put(("log", f"ERROR: {error_msg}"))
-
-        finally:
-            # Clean up temporary audio file if it was created
-            if temp_audio_path and os.path.exists(temp_audio_path):
-                try:
-                    os.unlink(temp_audio_path)
-                    self.result_queue.put(("log", "Temporary audio file cleaned up"))
-                except Exception as e:
-                    self.result_queue.put(("log", f"Warning: Could not delete temporary file: {str(e)}"))
-            self.result_queue.put(("finished", None))
-
     def check_queue(self) -> None:
         """Check results queue and update interface."""
-        try:
-            while True:
+        pending_logs: list[str] = []
+        drained = False
+        # Handle a bounded number of messages per tick so bursts don't block redraws
+        for _ in range(QUEUE_MESSAGES_PER_TICK):
+            try:
                 message_type, data = self.result_queue.get_nowait()
-
-                if message_type == "status" and data is not None:
-                    self.update_status(data)
-                elif message_type == "log" and data is not None:
-                    self.log_message(data)
-                elif message_type == "error" and data is not None:
-                    messagebox.showerror("Error", data)
-                elif message_type == "success" and data is not None:
-                    messagebox.showinfo("Success", data)
-                elif message_type == "finished":
-                    self.transcription_finished()
-
-        except queue.Empty:
-            pass
-
-        self.root.after(100, self.check_queue)
+            except queue.Empty:
+                drained = True
+                break
+
+            if message_type == "log" and data is not None:
+                pending_logs.append(data)
+                continue
+
+            # Keep log order relative to status changes and dialogs
+            if pending_logs:
+                self.log_message("\n".join(pending_logs))
+                pending_logs.clear()
+
+            if message_type == "status" and data is not None:
+                self.update_status(data)
+            elif message_type == "error" and data is not None:
+                messagebox.showerror("Error", data)
+            elif message_type == "success" and data is not None:
+                messagebox.showinfo("Success", data)
+            elif message_type == "finished":
+                self.transcription_finished()
+
+        if pending_logs:
+            self.log_message("\n".join(pending_logs))
+
+        if drained and self.is_transcribing and self.worker_process is not None and not self.worker_process.is_alive():
+            self.log_message(f"ERROR: Transcription process exited unexpectedly (code {self.worker_process.exitcode})")
+            messagebox.showerror("Error", "Transcription process exited unexpectedly")
+            self.transcription_finished()
+
+        # Come back sooner if messages are still waiting
+        self.root.after(QUEUE_POLL_IDLE_MS if drained else QUEUE_POLL_BUSY_MS, self.check_queue)
 
     def transcription_finished(self) -> None:
         """Called when transcription is finished."""
@@ -307,7 +251,7 @@ class TranscriptionGUI:
         self.update_status("Ready to work")
 
     def create_settings_frame(self, parent: ttk.Frame, row: int) -> None:
-        """Create settings block (language and model)."""
+        """Create settings block (language, model and device)."""
         settings_frame = ttk.LabelFrame(parent, text="Settings", padding="10")
         settings_frame.grid(row=row, column=0, columnspan=3, sticky="ew", pady=20)
         settings_frame.columnconfigure(1, weight=1)
@@ -316,7 +260,7 @@ class TranscriptionGUI:
         language_combo = ttk.Combobox(
             settings_frame,
             textvariable=self.state.language,
-            values=[lang.value for lang in Language],
+            values=LANGUAGE_VALUES,
             state="readonly",
         )
         language_combo.grid(row=0, column=1, sticky="ew", padx=(5, 0), pady=5)
@@ -325,11 +269,43 @@ class TranscriptionGUI:
         model_combo = ttk.Combobox(
             settings_frame,
             textvariable=self.state.model_size,
-            values=[size for size in AVAILABLE_MODELS.keys()],
+            values=MODEL_SIZES,
             state="readonly",
         )
         model_combo.grid(row=1, column=1, sticky="ew", padx=(5, 0), pady=5)
 
+        ttk.Label(settings_frame, text="Device:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        device_combo = ttk.Combobox(
+            settings_frame,
+            textvariable=self.state.device,
+            values=DEVICES,
+            state="readonly",
+        )
+        device_combo.grid(row=2, column=1, sticky="ew", padx=(5, 0), pady=5)
+
+        ttk.Label(settings_frame, text="Compute type:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.compute_type_combo = ttk.Combobox(
+            settings_frame,
+            textvariable=self.state.compute_type,
+            values=COMPUTE_TYPES[self.state.device.get()],
+            state="readonly",
+        )
+        self.compute_type_combo.grid(row=3, column=1, sticky="ew", padx=(5, 0), pady=5)
+
+        ttk.Label(settings_frame, text="Batch size (VAD only):").grid(row=4, column=0, sticky=tk.W, pady=5)
+        self.batch_size_spinbox = ttk.Spinbox(
+            settings_frame,
+            textvariable=self.state.batch_size,
+            from_=1,
+            to=64,
+            increment=1,
+            state="readonly",
+        )
+        self.batch_size_spinbox.grid(row=4, column=1, sticky="ew", padx=(5, 0), pady=5)
+
+        vad_checkbutton = ttk.Checkbutton(settings_frame, text="Skip silence (VAD)", variable=self.state.vad_filter)
+        vad_checkbutton.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=5)
+
     def create_file_selector(
         self, parent: ttk.Frame, row: int, label: str, var: tk.StringVar, on_browse: Callable[[], None]
     ) -> None:
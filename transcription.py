@@ -0,0 +1,177 @@
+import os
+from multiprocessing.queues import Queue
+from multiprocessing.synchronize import Event
+
+import numpy as np
+from download_models import download_model, is_model_downloaded
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from utils import (
+    AUTO_DEVICE,
+    AVAILABLE_MODELS,
+    HF_MODEL_MAPPING,
+    TranscriptionSettings,
+    cpu_thread_count,
+    pick_device,
+)
+
+SAMPLE_RATE = 16000
+WRITE_BUFFER_SIZE = 1 << 20
+VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+VIDEO_EXTENSIONS = frozenset({".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm", ".m4v"})
+
+
+def is_video_file(file_path: str) -> bool:
+    """Check if file is a video file based on extension."""
+    return os.path.splitext(file_path)[1].lower() in VIDEO_EXTENSIONS
+
+
+class Transcriber:
+    """Runs transcription jobs inside worker process and reports progress through result queue."""
+
+    def __init__(self, result_queue: "Queue[tuple[str, str | None]]", stop_flag: Event):
+        self.result_queue = result_queue
+        self.stop_flag = stop_flag
+        self._model_cache: dict[tuple[str, str, str], WhisperModel] = {}
+
+    def create_model(self, model_path: str, device: str, compute_type: str) -> WhisperModel:
+        """Create model from local files using all CPUs available to the process."""
+        return WhisperModel(
+            model_path,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_thread_count(),
+            local_files_only=True,
+        )
+
+    def load_model(self, model_size: str, device: str, compute_type: str) -> WhisperModel:
+        """Load model, reusing the cached one if settings did not change."""
+        if model_size not in AVAILABLE_MODELS:
+            self.result_queue.put(("log", f"Model '{model_size}' not found, using 'base'"))
+            model_size = "base"
+
+        cache_key = (model_size, device, compute_type)
+        if cache_key in self._model_cache:
+            self.result_queue.put(("log", f"Using already loaded model: {model_size}"))
+            return self._model_cache[cache_key]
+
+        model_path = AVAILABLE_MODELS[model_size]
+        # Check files up front instead of letting WhisperModel fail on a missing path
+        if not is_model_downloaded(model_path):
+            self.result_queue.put(("log", f"Model '{model_size}' not found, downloading..."))
+            repo_id = HF_MODEL_MAPPING[model_size]
+            download_model(model_name=model_size, repo_id=repo_id, local_path=model_path)
+            if not is_model_downloaded(model_path):
+                raise RuntimeError(f"Failed to download model '{model_size}'")
+            self.result_queue.put(("log", f"Model '{model_size}' downloaded successfully"))
+
+        model = self.create_model(model_path, device, compute_type)
+
+        # Run one second of silence through the model so the first real call doesn't pay kernel init cost
+        warmup_segments, _ = model.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32), beam_size=1)
+        list(warmup_segments)
+
+        # Keep only the most recently used model in memory
+        self._model_cache.clear()
+        self._model_cache[cache_key] = model
+        return model
+
+    def transcribe(self, settings: TranscriptionSettings) -> None:
+        """Transcribe one file and write result to output file."""
+        try:
+            input_path = settings.input_path
+            output_path = settings.output_path
+            language = settings.language
+            model_size = settings.model_size
+            device = settings.device
+            compute_type = settings.compute_type
+            batch_size = settings.batch_size
+            vad_filter = settings.vad_filter
+
+            if device == AUTO_DEVICE:
+                device, compute_type = pick_device()
+
+            self.result_queue.put(("status", "Loading model..."))
+            self.result_queue.put(("log", f"Loading model: {model_size} ({device}, {compute_type})"))
+
+            if self.stop_flag.is_set():
+                return
+
+            model = self.load_model(model_size, device, compute_type)
+
+            if self.stop_flag.is_set():
+                return
+
+            self.result_queue.put(("status", "Transcribing..."))
+            self.result_queue.put(("log", f"Starting transcription of file: {os.path.basename(input_path)}"))
+            if is_video_file(input_path):
+                self.result_queue.put(("log", "Video file detected, audio track will be decoded directly"))
+
+            if vad_filter:
+                # Batched inference relies on VAD to split audio into chunks.
+                # Defensive copy: the pipeline pops max_speech_duration_s from vad_parameters if present.
+                pipeline = BatchedInferencePipeline(model=model)
+                segments, info = pipeline.transcribe(
+                    input_path,
+                    batch_size=batch_size,
+                    beam_size=1,
+                    language=language,
+                    vad_filter=True,
+                    vad_parameters=dict(VAD_PARAMETERS),
+                    word_timestamps=False,
+                )
+            else:
+                # Greedy decoding without word alignment or prompt carry-over is the fast path
+                segments, info = model.transcribe(
+                    input_path,
+                    beam_size=1,
+                    language=language,
+                    vad_filter=False,
+                    word_timestamps=False,
+                    condition_on_previous_text=False,
+                )
+
+            if self.stop_flag.is_set():
+                return
+
+            self.result_queue.put(
+                ("log", f"Detected language: {info.language} (probability: {info.language_probability:.2f})")
+            )
+            self.result_queue.put(("log", f"Approximate duration: {info.duration:.2f} seconds"))
+
+            processed_segments = 0
+
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                for segment in segments:
+                    if self.stop_flag.is_set():
+                        self.result_queue.put(("log", "Transcription stopped by user"))
+                        break
+
+                    f.write(f"{segment.text.strip()}\n".encode("utf-8"))
+                    processed_segments += 1
+
+            if not self.stop_flag.is_set():
+                self.result_queue.put(("log", f"Transcription completed! Processed segments: {processed_segments}"))
+                self.result_queue.put(("log", f"Result saved to: {output_path}"))
+                self.result_queue.put(("success", "Transcription completed successfully!"))
+
+        except Exception as e:
+            error_msg = f"An error occurred: {str(e)}"
+            self.result_queue.put(("error", error_msg))
+            self.result_queue.put(("log", f"ERROR: {error_msg}"))
+
+        finally:
+            self.result_queue.put(("finished", None))
+
+
+def transcription_worker(
+    job_queue: "Queue[TranscriptionSettings | None]",
+    result_queue: "Queue[tuple[str, str | None]]",
+    stop_flag: Event,
+) -> None:
+    """Worker process entry point: run jobs until None is received."""
+    transcriber = Transcriber(result_queue, stop_flag)
+    while True:
+        settings = job_queue.get()
+        if settings is None:
+            break
+        transcriber.transcribe(settings)
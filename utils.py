@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 import tkinter as tk
 from dataclasses import dataclass
@@ -52,6 +53,9 @@ AVAILABLE_MODELS = {
     "large": "./models/models--Systran--faster-whisper-large",
 }
 
+MODEL_SIZES = tuple(AVAILABLE_MODELS)
+LANGUAGE_VALUES = tuple(lang.value for lang in Language)
+
 HF_MODEL_MAPPING = {
     "tiny": "Systran/faster-whisper-tiny",
     "tiny.en": "Systran/faster-whisper-tiny.en",
@@ -68,9 +72,70 @@ HF_MODEL_MAPPING = {
 }
 
 
+AUTO_DEVICE = "auto"
+DEVICES = (AUTO_DEVICE, "cpu", "cuda")
+# Compute types CTranslate2 supports on each device, the first one is the default.
+# "auto" device is resolved with pick_device() in the worker process.
+COMPUTE_TYPES = {
+    AUTO_DEVICE: (AUTO_DEVICE,),
+    "cpu": ("int8", "float32"),
+    "cuda": ("int8_float16", "float16", "int8", "float32"),
+}
+
+
+def pick_device() -> tuple[str, str]:
+    """Return (device, compute_type) best suited for this machine."""
+    try:
+        import ctranslate2
+
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda", COMPUTE_TYPES["cuda"][0]
+    except Exception as e:
+        logger.warning(f"CUDA detection failed, falling back to CPU: {e}")
+
+    return "cpu", COMPUTE_TYPES["cpu"][0]
+
+
+def cpu_thread_count() -> int:
+    """Return number of CPUs this process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@dataclass(frozen=True)
+class TranscriptionSettings:
+    input_path: str
+    output_path: str
+    language: str | None
+    model_size: str
+    device: str
+    compute_type: str
+    batch_size: int
+    vad_filter: bool
+
+
 @dataclass
 class AppState:
     audio_file: tk.StringVar
     output_file: tk.StringVar
     language: tk.StringVar
     model_size: tk.StringVar
+    device: tk.StringVar
+    compute_type: tk.StringVar
+    batch_size: tk.IntVar
+    vad_filter: tk.BooleanVar
+
+    def snapshot(self) -> TranscriptionSettings:
+        """Read current values of all variables so they can be used outside Tk thread."""
+        language = self.language.get()
+        return TranscriptionSettings(
+            input_path=self.audio_file.get(),
+            output_path=self.output_file.get(),
+            language=language if language != Language.AUTO else None,
+            model_size=self.model_size.get(),
+            device=self.device.get(),
+            compute_type=self.compute_type.get(),
+            batch_size=self.batch_size.get(),
+            vad_filter=self.vad_filter.get(),
+        )
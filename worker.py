@@ -0,0 +1,15 @@
+from multiprocessing.queues import Queue
+from multiprocessing.synchronize import Event
+
+from utils import TranscriptionSettings
+
+
+def run(
+    job_queue: "Queue[TranscriptionSettings | None]",
+    result_queue: "Queue[tuple[str, str | None]]",
+    stop_flag: Event,
+) -> None:
+    """Worker process target. Inference modules are imported here so only the child process loads them."""
+    from transcription import transcription_worker
+
+    transcription_worker(job_queue, result_queue, stop_flag)